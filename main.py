@@ -1,40 +1,164 @@
 import os
-from typing import List, Optional
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
+import time
+from typing import Dict, List, Optional, Tuple
+import orjson
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from datetime import datetime
+from pymongo import ASCENDING, DESCENDING, IndexModel, UpdateOne
+from pymongo.errors import DuplicateKeyError, PyMongoError
+from datetime import datetime, timedelta
 
 from database import db, create_document, get_documents
 from schemas import Article as ArticleSchema, Issue as IssueSchema, EditorialMember as EditorialMemberSchema, Submission as SubmissionSchema, Author as AuthorSchema, Section as SectionSchema, CitationFormats as CitationFormatsSchema
 
-app = FastAPI(title="E-Planet Journal API", description="Backend for E-Planet Journal website")
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+app = FastAPI(
+    title="E-Planet Journal API",
+    description="Backend for E-Planet Journal website",
+    default_response_class=ORJSONResponse,
 )
 
 
+# ----------------------
+# CORS (pure ASGI)
+# ----------------------
+
+_CORS_ALLOW_ANY_ORIGIN = (b"access-control-allow-origin", b"*")
+_CORS_ALLOW_CREDENTIALS = (b"access-control-allow-credentials", b"true")
+_CORS_VARY_ORIGIN = (b"vary", b"Origin")
+_CORS_RESPONSE_HEADER_NAMES = {b"access-control-allow-origin", b"access-control-allow-credentials"}
+
+# Preflight headers minus the per-request origin / requested headers
+_PREFLIGHT_HEADERS = [
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-max-age", b"600"),
+    _CORS_ALLOW_CREDENTIALS,
+    _CORS_VARY_ORIGIN,
+    (b"content-length", b"2"),
+    (b"content-type", b"text/plain; charset=utf-8"),
+]
+_PREFLIGHT_BODY = {"type": "http.response.body", "body": b"OK"}
+
+
+class ASGICors:
+    """Allow-all CORS with credentials, without wrapping requests in Starlette Request/Response objects.
+
+    Mirrors CORSMiddleware(allow_origins=["*"], allow_credentials=True, ...): preflights
+    and cookie-bearing requests get the request Origin reflected, since browsers reject
+    "*" on credentialed requests.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = requested_method = requested_headers = None
+        has_cookie = False
+        for key, value in scope["headers"]:
+            if key == b"origin":
+                origin = value
+            elif key == b"cookie":
+                has_cookie = True
+            elif key == b"access-control-request-method":
+                requested_method = value
+            elif key == b"access-control-request-headers":
+                requested_headers = value
+
+        if origin is None:
+            # Not a CORS request
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and requested_method is not None:
+            headers = _PREFLIGHT_HEADERS + [(b"access-control-allow-origin", origin)]
+            if requested_headers is not None:
+                headers.append((b"access-control-allow-headers", requested_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send(_PREFLIGHT_BODY)
+            return
+
+        if has_cookie:
+            cors_headers = [(b"access-control-allow-origin", origin), _CORS_ALLOW_CREDENTIALS]
+        else:
+            cors_headers = [_CORS_ALLOW_ANY_ORIGIN, _CORS_ALLOW_CREDENTIALS]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                # Build a new list so the response's own raw_headers aren't mutated, and
+                # replace rather than duplicate CORS headers the app may already have set
+                headers = []
+                vary = None
+                for name, value in message.get("headers", []):
+                    lowered = name.lower()
+                    if lowered in _CORS_RESPONSE_HEADER_NAMES:
+                        continue
+                    if lowered == b"vary" and has_cookie:
+                        vary = value
+                        continue
+                    headers.append((name, value))
+                headers.extend(cors_headers)
+                if has_cookie:
+                    headers.append((b"vary", vary + b", Origin" if vary else b"Origin"))
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+app.add_middleware(ASGICors)
+
+
 # ----------------------
 # Utility & Seed Data
 # ----------------------
 
-def collection(name: str):
-    if db is None:
-        return None
-    return db[name]
+# Collection handles, bound once so request paths skip db[...] lookups
+if db is not None:
+    ARTICLES, ISSUES, EDITORIAL, META = db["article"], db["issue"], db["editorialmember"], db["meta"]
+else:
+    ARTICLES = ISSUES = EDITORIAL = META = None
+
+
+def with_author_names(doc: dict) -> dict:
+    """Denormalize author names onto an article so read paths don't rebuild them."""
+    names = [a["name"] for a in doc.get("authors", [])]
+    return {**doc, "author_names": names, "author_names_str": ", ".join(names)}
+
+
+# Aggregation expression joining authors.name into "A, B", for the backfill
+JOIN_AUTHOR_NAMES = {
+    "$reduce": {
+        "input": {"$ifNull": ["$authors.name", []]},
+        "initialValue": "",
+        "in": {"$concat": ["$$value", {"$cond": [{"$eq": ["$$value", ""]}, "", ", "]}, "$$this"]},
+    }
+}
 
 
-def seed_if_needed():
-    """Seed demo content if collections are empty."""
+async def backfill_author_names():
+    """Add author_names / author_names_str to articles that lack them or hold nulls.
+
+    Unindexed full scan, so it runs once per deployment behind a META marker.
+    """
+    stale = {"$or": [
+        {"author_names": {"$not": {"$type": "array"}}},
+        {"author_names_str": {"$not": {"$type": "string"}}},
+    ]}
+    await ARTICLES.update_many(stale, [{"$set": {
+        "author_names": {"$ifNull": ["$authors.name", []]},
+        "author_names_str": JOIN_AUTHOR_NAMES,
+    }}])
+
+
+async def seed_if_needed() -> bool:
+    """Seed demo content; upserts make this safe to re-run. Returns False if seeding failed."""
     try:
         # Seed Editorial Board
-        coll = collection("editorialmember")
-        if coll is not None and coll.count_documents({}) == 0:
+        if EDITORIAL is not None:
             members = [
                 {
                     "role": "Chief Editor",
@@ -77,64 +201,154 @@ def seed_if_needed():
                     "photo_url": "https://images.unsplash.com/photo-1524504388940-b1c1722653e1?w=400&auto=format&fit=crop&q=60"
                 },
             ]
-            coll.insert_many(members)
+            await EDITORIAL.bulk_write(
+                [UpdateOne({"name": m["name"]}, {"$setOnInsert": m}, upsert=True) for m in members],
+                ordered=False,
+            )
 
         # Seed Issues and Articles
-        articles_coll = collection("article")
-        issues_coll = collection("issue")
-        if articles_coll is not None and issues_coll is not None:
-            if issues_coll.count_documents({}) == 0:
-                issues = [
-                    {"year": 2025, "volume": 23, "issue": 1, "title": "Volume 23, Issue 1 (2025)"},
-                    {"year": 2025, "volume": 23, "issue": 2, "title": "Volume 23, Issue 2 (2025)"},
-                ]
-                issues_coll.insert_many(issues)
-
-            if articles_coll.count_documents({}) == 0:
-                base_articles = []
-                for issue_num in [1, 2]:
-                    for i in range(1, 6):
-                        slug = f"sustainable-farming-{issue_num}-{i}"
-                        base_articles.append({
-                            "title": f"Sustainable Farming Practices {issue_num}.{i} for Climate Resilience",
-                            "slug": slug,
-                            "authors": [
-                                {"name": "R. Gupta", "affiliation": "AgriTech Lab, Delhi", "country": "India"},
-                                {"name": "S. Miller", "affiliation": "GreenFields Institute", "country": "USA"}
-                            ],
-                            "affiliations": ["AgriTech Lab, Delhi", "GreenFields Institute"],
-                            "abstract": "This study evaluates sustainable agricultural techniques improving yield while reducing environmental impact.",
-                            "keywords": ["sustainability", "agriculture", "climate", "soil"],
-                            "doi": None,
-                            "pdf_url": None,
-                            "year": 2025,
-                            "volume": 23,
-                            "issue": issue_num,
-                            "sections": [
-                                {"heading": "Introduction", "content": "Background, motivation, and objectives of the research."},
-                                {"heading": "Materials and Methods", "content": "Experimental design and data collection methods."},
-                                {"heading": "Results", "content": "Key findings with analysis and figures."},
-                                {"heading": "Discussion", "content": "Interpretation of results and implications."},
-                                {"heading": "Conclusion", "content": "Summary and future work."}
-                            ],
-                            "references": [
-                                "Smith J. (2022). Advances in Agroecology. Journal of Green Science.",
-                                "Lee K. (2021). Climate-smart Agriculture: A Review."
-                            ],
-                            "citation_formats": {
-                                "apa": f"Gupta, R., & Miller, S. (2025). Sustainable Farming Practices {issue_num}.{i} for Climate Resilience. E-Planet Journal, 23({issue_num}).",
-                                "mla": f"Gupta, R., and S. Miller. 'Sustainable Farming Practices {issue_num}.{i} for Climate Resilience.' E-Planet Journal 23.{issue_num} (2025).",
-                                "chicago": f"Gupta, R., and S. Miller. 2025. 'Sustainable Farming Practices {issue_num}.{i} for Climate Resilience.' E-Planet Journal 23, no. {issue_num}."
-                            },
-                            "cover_image": "https://images.unsplash.com/photo-1501004318641-b39e6451bec6?w=1200&auto=format&fit=crop&q=60"
-                        })
-                articles_coll.insert_many(base_articles)
+        if ARTICLES is not None and ISSUES is not None:
+            issues = [
+                {"year": 2025, "volume": 23, "issue": 1, "title": "Volume 23, Issue 1 (2025)"},
+                {"year": 2025, "volume": 23, "issue": 2, "title": "Volume 23, Issue 2 (2025)"},
+            ]
+            await ISSUES.bulk_write(
+                [
+                    UpdateOne({"year": x["year"], "volume": x["volume"], "issue": x["issue"]}, {"$setOnInsert": x}, upsert=True)
+                    for x in issues
+                ],
+                ordered=False,
+            )
+
+            # Fields shared by every demo article; only title/slug/issue/citations vary
+            article_template = {
+                "authors": [
+                    {"name": "R. Gupta", "affiliation": "AgriTech Lab, Delhi", "country": "India"},
+                    {"name": "S. Miller", "affiliation": "GreenFields Institute", "country": "USA"}
+                ],
+                "affiliations": ["AgriTech Lab, Delhi", "GreenFields Institute"],
+                "abstract": "This study evaluates sustainable agricultural techniques improving yield while reducing environmental impact.",
+                "keywords": ["sustainability", "agriculture", "climate", "soil"],
+                "doi": None,
+                "pdf_url": None,
+                "year": 2025,
+                "volume": 23,
+                "sections": [
+                    {"heading": "Introduction", "content": "Background, motivation, and objectives of the research."},
+                    {"heading": "Materials and Methods", "content": "Experimental design and data collection methods."},
+                    {"heading": "Results", "content": "Key findings with analysis and figures."},
+                    {"heading": "Discussion", "content": "Interpretation of results and implications."},
+                    {"heading": "Conclusion", "content": "Summary and future work."}
+                ],
+                "references": [
+                    "Smith J. (2022). Advances in Agroecology. Journal of Green Science.",
+                    "Lee K. (2021). Climate-smart Agriculture: A Review."
+                ],
+                "cover_image": "https://images.unsplash.com/photo-1501004318641-b39e6451bec6?w=1200&auto=format&fit=crop&q=60"
+            }
+            base_articles = []
+            for issue_num in [1, 2]:
+                for i in range(1, 6):
+                    title = f"Sustainable Farming Practices {issue_num}.{i} for Climate Resilience"
+                    base_articles.append({
+                        **article_template,
+                        "title": title,
+                        "slug": f"sustainable-farming-{issue_num}-{i}",
+                        "issue": issue_num,
+                        "citation_formats": {
+                            "apa": f"Gupta, R., & Miller, S. (2025). {title}. E-Planet Journal, 23({issue_num}).",
+                            "mla": f"Gupta, R., and S. Miller. '{title}.' E-Planet Journal 23.{issue_num} (2025).",
+                            "chicago": f"Gupta, R., and S. Miller. 2025. '{title}.' E-Planet Journal 23, no. {issue_num}."
+                        },
+                    })
+            await ARTICLES.bulk_write(
+                [UpdateOne({"slug": a["slug"]}, {"$setOnInsert": with_author_names(a)}, upsert=True) for a in base_articles],
+                ordered=False,
+            )
     except Exception:
         # If seeding fails (e.g., DB not configured), we silently ignore.
-        pass
+        return False
+    return True
+
+
+# Newest-first key: backs the compound indexes and is the sort for list routes
+NEWEST_FIRST = [("year", DESCENDING), ("volume", DESCENDING), ("issue", DESCENDING)]
+
+
+async def ensure_indexes():
+    """Create the indexes backing slug lookups and (year, volume, issue) filters."""
+    if ARTICLES is None:
+        return
+    await ARTICLES.create_indexes([
+        IndexModel([("slug", ASCENDING)], unique=True),
+        IndexModel(NEWEST_FIRST),
+    ])
+    await ISSUES.create_indexes([IndexModel(NEWEST_FIRST, unique=True)])
+
+
+# A claim on a startup task that hasn't finished within this window is treated
+# as abandoned (worker killed mid-run) and can be taken over
+STARTUP_TASK_CLAIM_TIMEOUT = timedelta(minutes=10)
+
 
+async def claim_startup_task(name: str) -> bool:
+    """Claim a once-per-deployment startup task via its META marker.
+
+    Markers are {"_id": name, "done": bool, "claimed_at": datetime}. The claim
+    succeeds when no marker exists yet or an earlier claim went stale without
+    finishing; it fails when the task is done or another worker is running it.
+    """
+    now = datetime.utcnow()
+    try:
+        await META.update_one(
+            {"_id": name, "done": False, "claimed_at": {"$lt": now - STARTUP_TASK_CLAIM_TIMEOUT}},
+            {"$set": {"claimed_at": now}},
+            upsert=True,
+        )
+    except DuplicateKeyError:
+        # The marker exists but didn't match: finished, or freshly claimed elsewhere
+        return False
+    return True
+
+
+async def finish_startup_task(name: str):
+    await META.update_one({"_id": name}, {"$set": {"done": True}})
 
-seed_if_needed()
+
+async def release_startup_task(name: str):
+    """Drop an unfinished claim so the next start retries immediately."""
+    await META.delete_one({"_id": name, "done": False})
+
+
+@app.on_event("startup")
+async def _on_startup():
+    if db is None:
+        return
+    try:
+        await ensure_indexes()
+    except Exception:
+        # Same policy as seeding: a missing or unreachable DB must not block startup.
+        pass
+    try:
+        # One-shot: the first worker to claim it backfills, later starts skip it
+        if await claim_startup_task("author_names_backfill"):
+            try:
+                await backfill_author_names()
+            except PyMongoError:
+                await release_startup_task("author_names_backfill")
+            else:
+                await finish_startup_task("author_names_backfill")
+    except Exception:
+        pass
+    try:
+        # Only the worker holding the claim seeds; the others skip straight to serving
+        if await claim_startup_task("seed"):
+            if await seed_if_needed():
+                await finish_startup_task("seed")
+            else:
+                await release_startup_task("seed")
+    except Exception:
+        pass
 
 
 # ----------------------
@@ -159,56 +373,213 @@ class ArticleCard(BaseModel):
     issue: int
 
 
+class ArticleOut(ArticleSchema):
+    """Response shape for GET /api/articles/{slug}; URLs are returned as stored strings.
+
+    Documents the response only: the database path returns stored documents directly.
+    Denormalized fields (author_names, author_names_str) are not part of it.
+    """
+    pdf_url: Optional[str] = None
+    cover_image: Optional[str] = None
+
+
+class EditorialMemberOut(EditorialMemberSchema):
+    """Response shape for GET /api/editorial-board; documents the response only."""
+    photo_url: Optional[str] = None
+
+
+# Fields fetched from MongoDB for the response models above. Article cards leave
+# the heavy sections/references/citation_formats/cover_image fields on the server.
+ISSUE_FIELDS = {"year": 1, "volume": 1, "issue": 1, "title": 1, "description": 1, "_id": 0}
+ARTICLE_CARD_FIELDS = {"title": 1, "slug": 1, "author_names": 1, "doi": 1, "year": 1, "volume": 1, "issue": 1, "_id": 0}
+
+# Cursor batch size for list routes, so decoding overlaps later fetches
+LIST_BATCH_SIZE = 200
+
+# Write timestamps added by create_document; not part of any response model
+WRITE_TIMESTAMPS = {"created_at": 0, "updated_at": 0}
+
+# Article pages and editorial board match ArticleOut / EditorialMemberOut: no ObjectId
+# (not JSON-encodable), no write timestamps, and no denormalized list fields
+ARTICLE_FIELDS = {"_id": 0, **WRITE_TIMESTAMPS, "author_names": 0, "author_names_str": 0}
+EDITORIAL_FIELDS = {"_id": 0, **WRITE_TIMESTAMPS}
+
+# Issue table-of-contents rows; authors come pre-joined as "A, B"
+ISSUE_ARTICLE_FIELDS = {"_id": 0, "title": 1, "doi": 1, "slug": 1, "authors": "$author_names_str"}
+
+
+# ----------------------
+# Static payloads (serialized once at import)
+# ----------------------
+
+GUIDELINES_BYTES = orjson.dumps({
+    "author_guidelines": [
+        "Manuscripts must be original and not under consideration elsewhere.",
+        "Follow IMRAD structure: Introduction, Methods, Results, and Discussion.",
+        "Maximum 6000 words, 6 figures, and 40 references for research articles.",
+        "Use APA style for citations and references.",
+        "Include ORCID IDs where available."
+    ],
+    "publication_ethics": [
+        "We follow COPE guidelines for publication ethics.",
+        "All submissions are screened for plagiarism using standard tools.",
+        "Conflicts of interest must be declared by all authors."
+    ],
+    "peer_review_process": "Double-blind peer review with at least two independent reviewers.",
+    "formatting_template_url": "#",
+    "submission_email": "submit@e-planetjournal.org"
+})
+
+ABOUT_BYTES = orjson.dumps({
+    "name": "E-Planet: An International Journal of Environmental & Agricultural Research",
+    "issn_online": "XXXX-XXXX",
+    "issn_print": "XXXX-XXXX",
+    "naas_rating": 4.73,
+    "mission": "To publish high-quality research in environmental and agricultural sciences that advances knowledge and informs practice.",
+    "scope": [
+        "Sustainable agriculture and agroecology",
+        "Climate change impact and adaptation",
+        "Soil science and water resource management",
+        "Biodiversity and ecosystem services",
+        "Environmental policy and governance"
+    ],
+    "frequency": "Quarterly",
+    "indexing": ["Google Scholar", "CrossRef", "Directory of Open Access Journals (DOAJ) - placeholder"],
+    "timeline": "Average time to first decision: 4-6 weeks. Online-first publication upon acceptance.",
+    "contact": {
+        "email": "info@e-planetjournal.org",
+        "address": "E-Planet Journal Editorial Office, 123 Green Avenue, New Delhi, India",
+    }
+})
+
+_ROOT_PREFIX = b'{"name":"E-Planet Journal API","status":"ok","time":"'
+
+
+# ----------------------
+# Response cache (read-mostly routes)
+# ----------------------
+
+RESPONSE_CACHE_TTL = 60.0
+
+_response_cache: Dict[str, Tuple[bytes, float]] = {}
+
+
+def cached_response(key: str) -> Optional[Response]:
+    """Return the cached JSON response for key, or None if missing or expired."""
+    entry = _response_cache.get(key)
+    if entry is not None and entry[1] > time.monotonic():
+        return Response(content=entry[0], media_type="application/json")
+    return None
+
+
+def cache_response(key: str, payload) -> Response:
+    """Serialize payload once, keep it for RESPONSE_CACHE_TTL seconds and return it."""
+    body = orjson.dumps(payload)
+    _response_cache[key] = (body, time.monotonic() + RESPONSE_CACHE_TTL)
+    return Response(content=body, media_type="application/json")
+
+
+# ----------------------
+# Demo fallbacks (no database or database errors)
+# ----------------------
+
+FALLBACK_ISSUES_BYTES = orjson.dumps([
+    {"year": 2025, "volume": 23, "issue": 2, "title": "Volume 23, Issue 2 (2025)", "description": None},
+    {"year": 2025, "volume": 23, "issue": 1, "title": "Volume 23, Issue 1 (2025)", "description": None},
+])
+
+FALLBACK_ISSUE_ARTICLES = [
+    {"title": "Demo Article 1", "authors": "A. Author, B. Author", "doi": None, "slug": "demo-article-1"},
+    {"title": "Demo Article 2", "authors": "C. Researcher", "doi": None, "slug": "demo-article-2"},
+]
+
+FALLBACK_ARTICLES_BYTES = orjson.dumps([
+    {"title": "Demo Article", "slug": "demo-article", "authors": ["A. Author"], "doi": None, "year": 2025, "volume": 23, "issue": 1}
+])
+
+FALLBACK_ARTICLE = {
+    "title": "Demo Article Title",
+    "slug": "demo-article",
+    "authors": [{"name": "A. Author", "affiliation": "Demo University", "country": "USA"}],
+    "affiliations": ["Demo University"],
+    "abstract": "This is a demonstration abstract for the E-Planet Journal article page.",
+    "keywords": ["demo", "journal"],
+    "doi": None,
+    "pdf_url": None,
+    "year": 2025,
+    "volume": 23,
+    "issue": 1,
+    "sections": [
+        {"heading": "Introduction", "content": "Intro content."},
+        {"heading": "Methods", "content": "Methods content."},
+        {"heading": "Results", "content": "Results content."},
+        {"heading": "Discussion", "content": "Discussion content."},
+        {"heading": "Conclusion", "content": "Conclusion content."}
+    ],
+    "references": ["Reference 1", "Reference 2"],
+    "citation_formats": {
+        "apa": "Author, A. (2025). Demo Article Title. E-Planet Journal, 23(1).",
+        "mla": "Author, A. 'Demo Article Title.' E-Planet Journal 23.1 (2025).",
+        "chicago": "Author, A. 2025. 'Demo Article Title.' E-Planet Journal 23, no. 1."
+    },
+    "cover_image": "https://images.unsplash.com/photo-1501004318641-b39e6451bec6?w=1200&auto=format&fit=crop&q=60"
+}
+
+FALLBACK_EDITORIAL_BYTES = orjson.dumps([
+    {"role": "Chief Editor", "name": "Prof. A. K. Sharma", "designation": "Professor", "affiliation": "Green Earth University", "country": "India"}
+])
+
+
 # ----------------------
 # Routes
 # ----------------------
 
 @app.get("/")
-def root():
-    return {"name": "E-Planet Journal API", "status": "ok", "time": datetime.utcnow().isoformat()}
+async def root():
+    body = _ROOT_PREFIX + datetime.utcnow().isoformat().encode() + b'"}'
+    return Response(content=body, media_type="application/json")
 
 
-@app.get("/api/issues", response_model=List[IssueResponse])
-def list_issues():
+# Documents come from our own validated writes, so list routes build their
+# models with model_construct and skip FastAPI's response re-validation; the
+# models stay in the OpenAPI schema through `responses`.
+@app.get("/api/issues", response_model=None, responses={200: {"model": List[IssueResponse]}})
+async def list_issues():
+    if db is None:
+        return Response(content=FALLBACK_ISSUES_BYTES, media_type="application/json")
+    cached = cached_response("issues")
+    if cached is not None:
+        return cached
     try:
-        issues = get_documents("issue")
-        # Sort by year desc, issue desc
-        issues_sorted = sorted(issues, key=lambda x: (x.get("year", 0), x.get("volume", 0), x.get("issue", 0)), reverse=True)
-        return [IssueResponse(year=i.get("year"), volume=i.get("volume"), issue=i.get("issue"), title=i.get("title"), description=i.get("description")) for i in issues_sorted]
-    except Exception:
-        # Fallback demo data if DB not available
-        return [
-            IssueResponse(year=2025, volume=23, issue=2, title="Volume 23, Issue 2 (2025)"),
-            IssueResponse(year=2025, volume=23, issue=1, title="Volume 23, Issue 1 (2025)")
-        ]
+        # Newest first, sorted by MongoDB
+        issues = get_documents(ISSUES, projection=ISSUE_FIELDS, sort=NEWEST_FIRST)
+        return cache_response("issues", [
+            {"year": i["year"], "volume": i["volume"], "issue": i["issue"], "title": i.get("title"), "description": i.get("description")}
+            async for i in issues
+        ])
+    except PyMongoError:
+        return Response(content=FALLBACK_ISSUES_BYTES, media_type="application/json")
 
 
 @app.get("/api/issues/{year}/{volume}/{issue}")
-def get_issue(year: int, volume: int, issue: int):
+async def get_issue(year: int, volume: int, issue: int):
+    if ARTICLES is None:
+        return {"year": year, "volume": volume, "issue": issue, "articles": FALLBACK_ISSUE_ARTICLES}
     try:
-        articles = get_documents("article", {"year": year, "volume": volume, "issue": issue})
-        issue_info = {"year": year, "volume": volume, "issue": issue, "articles": []}
-        for a in articles:
-            issue_info["articles"].append({
-                "title": a.get("title"),
-                "authors": ", ".join([auth.get("name") for auth in a.get("authors", [])]),
-                "doi": a.get("doi"),
-                "slug": a.get("slug"),
-            })
-        return issue_info
-    except Exception:
-        # Fallback structure
-        return {
-            "year": year, "volume": volume, "issue": issue,
-            "articles": [
-                {"title": "Demo Article 1", "authors": "A. Author, B. Author", "doi": None, "slug": "demo-article-1"},
-                {"title": "Demo Article 2", "authors": "C. Researcher", "doi": None, "slug": "demo-article-2"},
-            ]
-        }
+        pipeline = [
+            {"$match": {"year": year, "volume": volume, "issue": issue}},
+            {"$project": ISSUE_ARTICLE_FIELDS},
+        ]
+        articles = await ARTICLES.aggregate(pipeline).to_list(length=None)
+        return {"year": year, "volume": volume, "issue": issue, "articles": articles}
+    except PyMongoError:
+        return {"year": year, "volume": volume, "issue": issue, "articles": FALLBACK_ISSUE_ARTICLES}
 
 
-@app.get("/api/articles", response_model=List[ArticleCard])
-def list_articles(year: Optional[int] = None, volume: Optional[int] = None, issue: Optional[int] = None):
+@app.get("/api/articles", response_model=None, responses={200: {"model": List[ArticleCard]}})
+async def list_articles(year: Optional[int] = None, volume: Optional[int] = None, issue: Optional[int] = None):
+    if db is None:
+        return Response(content=FALLBACK_ARTICLES_BYTES, media_type="application/json")
     filt = {}
     if year is not None:
         filt["year"] = year
@@ -217,154 +588,100 @@ def list_articles(year: Optional[int] = None, volume: Optional[int] = None, issu
     if issue is not None:
         filt["issue"] = issue
     try:
-        articles = get_documents("article", filt)
-        cards = []
-        for a in articles:
-            cards.append(ArticleCard(
-                title=a.get("title"),
-                slug=a.get("slug"),
-                authors=[auth.get("name") for auth in a.get("authors", [])],
-                doi=a.get("doi"),
-                year=a.get("year"),
-                volume=a.get("volume"),
-                issue=a.get("issue"),
-            ))
-        # Newest first
-        cards.sort(key=lambda x: (x.year, x.volume, x.issue), reverse=True)
-        return cards
-    except Exception:
-        return [
-            ArticleCard(title="Demo Article", slug="demo-article", authors=["A. Author"], doi=None, year=2025, volume=23, issue=1)
-        ]
+        # Newest first, sorted by MongoDB
+        articles = get_documents(ARTICLES, filt, projection=ARTICLE_CARD_FIELDS, sort=NEWEST_FIRST, batch_size=LIST_BATCH_SIZE)
+        return [ArticleCard.model_construct(
+            title=a["title"],
+            slug=a["slug"],
+            authors=a["author_names"],
+            doi=a.get("doi"),
+            year=a["year"],
+            volume=a["volume"],
+            issue=a["issue"],
+        ) async for a in articles]
+    except PyMongoError:
+        return Response(content=FALLBACK_ARTICLES_BYTES, media_type="application/json")
+
+
+@app.get("/api/articles/{slug}", response_model=ArticleOut)
+async def get_article(slug: str):
+    if ARTICLES is None:
+        return {**FALLBACK_ARTICLE, "slug": slug}
+    try:
+        a = await ARTICLES.find_one({"slug": slug}, projection=ARTICLE_FIELDS)
+    except PyMongoError:
+        return {**FALLBACK_ARTICLE, "slug": slug}
+    if not a:
+        raise HTTPException(status_code=404, detail="Article not found")
+    return ORJSONResponse(a)
 
 
-@app.get("/api/articles/{slug}")
-def get_article(slug: str):
-    try:
-        coll = collection("article")
-        if coll is None:
-            raise Exception("No DB")
-        a = coll.find_one({"slug": slug})
-        if not a:
-            raise HTTPException(status_code=404, detail="Article not found")
-        a["_id"] = str(a.get("_id"))
-        return a
-    except HTTPException:
-        raise
-    except Exception:
-        # Fallback demo article
-        return {
-            "title": "Demo Article Title",
-            "slug": slug,
-            "authors": [{"name": "A. Author", "affiliation": "Demo University", "country": "USA"}],
-            "affiliations": ["Demo University"],
-            "abstract": "This is a demonstration abstract for the E-Planet Journal article page.",
-            "keywords": ["demo", "journal"],
-            "doi": None,
-            "pdf_url": None,
-            "year": 2025,
-            "volume": 23,
-            "issue": 1,
-            "sections": [
-                {"heading": "Introduction", "content": "Intro content."},
-                {"heading": "Methods", "content": "Methods content."},
-                {"heading": "Results", "content": "Results content."},
-                {"heading": "Discussion", "content": "Discussion content."},
-                {"heading": "Conclusion", "content": "Conclusion content."}
-            ],
-            "references": ["Reference 1", "Reference 2"],
-            "citation_formats": {
-                "apa": "Author, A. (2025). Demo Article Title. E-Planet Journal, 23(1).",
-                "mla": "Author, A. 'Demo Article Title.' E-Planet Journal 23.1 (2025).",
-                "chicago": "Author, A. 2025. 'Demo Article Title.' E-Planet Journal 23, no. 1."
-            },
-            "cover_image": "https://images.unsplash.com/photo-1501004318641-b39e6451bec6?w=1200&auto=format&fit=crop&q=60"
-        }
-
-
-@app.get("/api/editorial-board")
-def editorial_board():
+@app.get("/api/editorial-board", response_model=List[EditorialMemberOut])
+async def editorial_board():
+    if db is None:
+        return Response(content=FALLBACK_EDITORIAL_BYTES, media_type="application/json")
+    cached = cached_response("editorial-board")
+    if cached is not None:
+        return cached
     try:
-        return get_documents("editorialmember")
-    except Exception:
-        return [
-            {"role": "Chief Editor", "name": "Prof. A. K. Sharma", "designation": "Professor", "affiliation": "Green Earth University", "country": "India"}
-        ]
+        members = await get_documents(EDITORIAL, projection=EDITORIAL_FIELDS).to_list(length=None)
+        return cache_response("editorial-board", members)
+    except PyMongoError:
+        return Response(content=FALLBACK_EDITORIAL_BYTES, media_type="application/json")
 
 
 @app.get("/api/guidelines")
-def guidelines():
-    return {
-        "author_guidelines": [
-            "Manuscripts must be original and not under consideration elsewhere.",
-            "Follow IMRAD structure: Introduction, Methods, Results, and Discussion.",
-            "Maximum 6000 words, 6 figures, and 40 references for research articles.",
-            "Use APA style for citations and references.",
-            "Include ORCID IDs where available."
-        ],
-        "publication_ethics": [
-            "We follow COPE guidelines for publication ethics.",
-            "All submissions are screened for plagiarism using standard tools.",
-            "Conflicts of interest must be declared by all authors."
-        ],
-        "peer_review_process": "Double-blind peer review with at least two independent reviewers.",
-        "formatting_template_url": "#",
-        "submission_email": "submit@e-planetjournal.org"
-    }
+async def guidelines():
+    return Response(content=GUIDELINES_BYTES, media_type="application/json")
 
 
 @app.get("/api/about")
-def about():
-    return {
-        "name": "E-Planet: An International Journal of Environmental & Agricultural Research",
-        "issn_online": "XXXX-XXXX",
-        "issn_print": "XXXX-XXXX",
-        "naas_rating": 4.73,
-        "mission": "To publish high-quality research in environmental and agricultural sciences that advances knowledge and informs practice.",
-        "scope": [
-            "Sustainable agriculture and agroecology",
-            "Climate change impact and adaptation",
-            "Soil science and water resource management",
-            "Biodiversity and ecosystem services",
-            "Environmental policy and governance"
-        ],
-        "frequency": "Quarterly",
-        "indexing": ["Google Scholar", "CrossRef", "Directory of Open Access Journals (DOAJ) - placeholder"],
-        "timeline": "Average time to first decision: 4-6 weeks. Online-first publication upon acceptance.",
-        "contact": {
-            "email": "info@e-planetjournal.org",
-            "address": "E-Planet Journal Editorial Office, 123 Green Avenue, New Delhi, India",
-        }
-    }
+async def about():
+    return Response(content=ABOUT_BYTES, media_type="application/json")
 
 
 @app.post("/api/submit")
-def submit_paper(payload: SubmissionSchema):
+async def submit_paper(payload: SubmissionSchema):
+    if db is None:
+        return {"status": "received", "id": None}
     try:
-        doc_id = create_document("submission", payload)
-        return {"status": "received", "id": doc_id}
-    except Exception:
+        doc_id = await create_document("submission", payload)
+    except PyMongoError:
         return {"status": "received", "id": None}
+    return {"status": "received", "id": doc_id}
+
+
+# Environment doesn't change while the process runs
+DATABASE_URL_STATUS = "✅ Set" if os.getenv("DATABASE_URL") else "❌ Not Set"
+DATABASE_NAME_STATUS = "✅ Set" if os.getenv("DATABASE_NAME") else "❌ Not Set"
+
+COLLECTIONS_CACHE_TTL = 30.0
+
+# (collection names, expiry on the monotonic clock)
+_collections_cache: Tuple[Optional[List[str]], float] = (None, 0.0)
 
 
 @app.get("/test")
-def test_database():
+async def test_database():
+    global _collections_cache
     response = {
         "backend": "✅ Running",
         "database": "❌ Not Available",
-        "database_url": None,
-        "database_name": None,
+        "database_url": DATABASE_URL_STATUS,
+        "database_name": DATABASE_NAME_STATUS,
         "connection_status": "Not Connected",
         "collections": []
     }
     try:
         if db is not None:
             response["database"] = "✅ Available"
-            response["database_url"] = "✅ Configured"
-            response["database_name"] = db.name
             response["connection_status"] = "Connected"
             try:
-                collections = db.list_collection_names()
+                collections, expires = _collections_cache
+                now = time.monotonic()
+                if collections is None or expires <= now:
+                    collections = await db.list_collection_names()
+                    _collections_cache = (collections, now + COLLECTIONS_CACHE_TTL)
                 response["collections"] = collections[:10]
                 response["database"] = "✅ Connected & Working"
             except Exception as e:
@@ -373,13 +690,19 @@ def test_database():
             response["database"] = "⚠️  Available but not initialized"
     except Exception as e:
         response["database"] = f"❌ Error: {str(e)[:50]}"
-    import os as _os
-    response["database_url"] = "✅ Set" if _os.getenv("DATABASE_URL") else "❌ Not Set"
-    response["database_name"] = "✅ Set" if _os.getenv("DATABASE_NAME") else "❌ Not Set"
     return response
 
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Multiple workers require the app as an import string
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", 2)),
+        log_level="warning",
+    )